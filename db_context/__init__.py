@@ -1,14 +1,20 @@
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
-from .database import DatabaseConnector
+from .database import DatabaseConnector, QueryTimeoutError
 from .schema.manager import SchemaManager
 from .models import TableInfo
 
+__all__ = ["DatabaseContext", "QueryTimeoutError"]
+
 
 class DatabaseContext:
-    def __init__(self, connection_string: str, cache_path: Path, target_schema: Optional[str] = None,  use_thick_mode: bool = False, lib_dir: Optional[str] = None):
-        self.db_connector = DatabaseConnector(connection_string, target_schema, use_thick_mode, lib_dir)
+    def __init__(self, connection_string: str, cache_path: Path, target_schema: Optional[str] = None,  use_thick_mode: bool = False, lib_dir: Optional[str] = None,
+                 pool_min: int = 2, pool_max: int = 20, pool_increment: int = 2, pool_burst_max: int = 40,
+                 call_timeout_ms: int = 30000):
+        self.db_connector = DatabaseConnector(connection_string, target_schema, use_thick_mode, lib_dir,
+                                              pool_min, pool_max, pool_increment, pool_burst_max,
+                                              call_timeout_ms)
         self.schema_manager = SchemaManager(self.db_connector, cache_path)
         # Set the schema manager reference in the connector
         self.db_connector.set_schema_manager(self.schema_manager)
@@ -22,6 +28,14 @@ class DatabaseContext:
         """Close the database context and connection pool"""
         await self.db_connector.close_pool()
         
+    def invalidate_object(self, object_name: str) -> None:
+        """Forget cached metadata for an object, e.g. after it was altered"""
+        self.schema_manager.invalidate(object_name)
+        
+    def clear_object_cache(self) -> None:
+        """Forget all cached object metadata without rebuilding the table index"""
+        self.schema_manager.clear_cache()
+        
     async def get_database_info(self):
         """Get information about the database vendor and version"""
         return await self.db_connector.get_database_info()
@@ -30,6 +44,10 @@ class DatabaseContext:
         """Get schema information for a specific table"""
         return await self.schema_manager.get_schema_info(table_name)
     
+    async def get_schemas_info(self, table_names: List[str]) -> Dict[str, Optional[TableInfo]]:
+        """Get schema information for several tables at once"""
+        return await self.schema_manager.get_schemas_info(table_names)
+    
     async def search_tables(self, search_term: str, limit: int = 20) -> List[str]:
         """Search for table names matching the search term"""
         return await self.schema_manager.search_tables(search_term, limit)
@@ -37,6 +55,9 @@ class DatabaseContext:
     async def rebuild_cache(self) -> None:
         """Force a rebuild of the schema cache"""
         self.schema_manager.cache = await self.schema_manager.load_or_build_cache(force_rebuild=True)
+        # Refresh constraints and indexes for the whole schema in bulk
+        self.schema_manager.clear_cache()
+        await self.db_connector.preload_schema_metadata()
         
     async def search_columns(self, search_term: str, limit: int = 50) -> Dict[str, List[Dict[str, Any]]]:
         """Search for columns matching the given pattern across all tables"""
@@ -59,6 +80,22 @@ class DatabaseContext:
         await self.schema_manager.save_cache()
         return result
         
+    async def get_pl_sql_objects_bulk(self, object_types: List[str], name_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get information about PL/SQL objects of several types at once"""
+        # Order and repeats of the requested types don't change the result
+        object_types = sorted(set(object_types))
+        cache_key = f"{','.join(object_types)}_{name_pattern or 'all'}"
+        if self.schema_manager.is_cache_valid('plsql', cache_key):
+            self.schema_manager.cache_stats['hits'] += 1
+            return self.schema_manager.object_cache['plsql'][cache_key]['data']
+        
+        self.schema_manager.cache_stats['misses'] += 1
+        result = await self.db_connector.get_pl_sql_objects_bulk(object_types, name_pattern)
+        
+        self.schema_manager.update_cache('plsql', cache_key, result)
+        await self.schema_manager.save_cache()
+        return result
+        
     async def get_object_source(self, object_type: str, object_name: str) -> str:
         """Get the source code for a PL/SQL object"""
         return await self.db_connector.get_object_source(object_type, object_name)
@@ -66,6 +103,7 @@ class DatabaseContext:
     async def get_table_constraints(self, table_name: str) -> List[Dict[str, Any]]:
         """Get constraints for a specific table"""
         # Check cache first
+        table_name = table_name.upper()
         if self.schema_manager.is_cache_valid('constraints', table_name):
             self.schema_manager.cache_stats['hits'] += 1
             return self.schema_manager.object_cache['constraints'][table_name]['data']
@@ -82,6 +120,7 @@ class DatabaseContext:
     async def get_table_indexes(self, table_name: str) -> List[Dict[str, Any]]:
         """Get indexes for a specific table"""
         # Check cache first
+        table_name = table_name.upper()
         if self.schema_manager.is_cache_valid('indexes', table_name):
             self.schema_manager.cache_stats['hits'] += 1
             return self.schema_manager.object_cache['indexes'][table_name]['data']
@@ -119,7 +158,7 @@ class DatabaseContext:
     async def get_related_tables(self, table_name: str) -> Dict[str, List[str]]:
         """Get all tables that are related to the specified table through foreign keys."""
         # Check cache first
-        cache_key = f"related_{table_name}"
+        cache_key = f"related_{table_name.upper()}"
         if self.schema_manager.is_cache_valid('related_tables', cache_key):
             self.schema_manager.cache_stats['hits'] += 1
             return self.schema_manager.object_cache['related_tables'][cache_key]['data']
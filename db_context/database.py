@@ -1,17 +1,272 @@
 import sys
+import re
+import logging
 import oracledb
 import time
 import asyncio
-from typing import Dict, List, Set, Optional, Any, Tuple
+import uuid
+import heapq
+from typing import AsyncIterator, Dict, List, Set, Optional, Any, Tuple
 from pathlib import Path
-from difflib import SequenceMatcher
+from collections import OrderedDict, defaultdict
+from itertools import islice
 from .models import SchemaManager
 
+logger = logging.getLogger(__name__)
+
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+def _char_masks(pattern: str) -> Dict[str, int]:
+    """Map each character of pattern to a bit mask of the positions where it occurs"""
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _lcs_length(pattern_masks: Dict[str, int], pattern_len: int, text: str) -> int:
+    """Longest common subsequence length using the bit-parallel algorithm of Hyyrö.
+
+    Each character of text costs a handful of integer operations regardless of the
+    pattern length, instead of a full row of a dynamic-programming table.
+    """
+    full = (1 << pattern_len) - 1
+    v = full
+    mask_of = pattern_masks.get  # bound once; this loop is the hot path of name scoring
+    for ch in text:
+        u = v & mask_of(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return pattern_len - v.bit_count()
+
+
+# Minimum similarity (0-1) for a name to count as a fuzzy match
+SIMILARITY_THRESHOLD = 0.65
+
+# Seconds a fetched list of table/view names is reused by searches
+NAME_CACHE_TTL = 60
+
+# Seconds preloaded constraints/indexes are trusted; matches SchemaManager.ttl for both
+PRELOAD_TTL = 3600
+
+# Number of explained queries whose plans are kept
+PLAN_CACHE_SIZE = 512
+# Seconds a cached plan is reused; plans change with new indexes and statistics
+PLAN_CACHE_TTL = 600
+# Quoted literals and identifiers (group 1, kept as-is), or a run of whitespace, line
+# comments and block comments that are not optimizer hints
+_SQL_NORMALIZE_RE = re.compile(
+    r"('(?:[^']|'')*'|\"[^\"]*\")|(?:\s|--[^\n]*|/\*(?!\+).*?\*/)+",
+    re.DOTALL
+)
+
+# Tokens looked for by _analyze_query_for_optimization, matched case-insensitively in
+# one pass over the query. Surrounding spaces, and the SELECT after IN (, are lookarounds
+# so adjacent tokens both match; specific hints come before the generic one.
+_OPTIMIZATION_TOKENS_RE = re.compile(
+    r"(?P<select_star>SELECT \*)"
+    r"|(?P<leading_wildcard>(?<= )LIKE '%)"
+    r"|(?P<in_subquery>(?<= )IN \((?=SELECT ))"
+    r"|(?P<exists>(?<= )EXISTS)"
+    r"|(?P<or>(?<= )OR(?= ))"
+    r"|(?P<join>(?<= )JOIN(?= ))"
+    r"|(?P<from>(?<= )FROM(?= ))"
+    r"|(?P<hint_leading>/\*\+ LEADING)"
+    r"|(?P<hint_use_nl>/\*\+ USE_NL)"
+    r"|(?P<hint_use_hash>/\*\+ USE_HASH)"
+    r"|(?P<hint>/\*\+ )",
+    re.IGNORECASE
+)
+
+# Feature bits for the optimization rules: one per token above, plus derived ones
+_TOKEN_BITS = {name: 1 << bit for bit, name in enumerate(_OPTIMIZATION_TOKENS_RE.groupindex)}
+_ANY_HINT = sum(bit for name, bit in _TOKEN_BITS.items() if name.startswith("hint"))
+_LONG_QUERY = 1 << len(_TOKEN_BITS)   # longer than 500 characters
+_MULTI_JOIN = _LONG_QUERY << 1        # more than one JOIN
+_MANY_JOINS = _LONG_QUERY << 2        # more than two JOINs
+
+# Rows fetched per round trip; python-oracledb defaults to 100
+DEFAULT_ARRAYSIZE = 5000
+LARGE_ARRAYSIZE = 10000
+SMALL_ARRAYSIZE = 500
+COLUMN_SEARCH_ARRAYSIZE = 1000
+
+# IN-list sizes; lists are padded up to one of these so each size maps to a single
+# SQL text that the statement cache and shared pool can reuse
+IN_LIST_BUCKETS = (8, 32, 128, 512)
+
+
+def _in_list_binds(values: List[str], prefix: str) -> Tuple[str, Dict[str, str]]:
+    """Placeholders and binds for ``IN (...)``, padded to the next bucket size.
+
+    Padding repeats the last value, which does not change the result of the IN.
+    ``values`` must not be longer than the largest bucket.
+    """
+    slots = next(size for size in IN_LIST_BUCKETS if size >= len(values))
+    padded = values + [values[-1]] * (slots - len(values))
+    placeholders = ", ".join(f":{prefix}{i}" for i in range(slots))
+    return placeholders, {f"{prefix}{i}": value for i, value in enumerate(padded)}
+
+
+# Statements kept parsed per pooled connection
+STATEMENT_CACHE_SIZE = 50
+
+# How long to wait for a free pooled connection before opening a burst connection
+POOL_WAIT_TIMEOUT_MS = 2000
+# Pool acquire timeouts (thin, thick)
+POOL_TIMEOUT_ERRORS = ("DPY-4005", "ORA-24457")
+# Call timeouts (thin, thick), dropped connections and server-side connect timeouts
+TIMEOUT_ERRORS = ("DPY-4024", "DPI-1067", "DPY-4011", "ORA-03136")
+
+
+class QueryTimeoutError(oracledb.OperationalError):
+    """A database call exceeded the configured timeout, or no connection became free in time"""
+
+
+# Check if the object exists and get its type
+_OBJECT_TYPE_SQL = """
+    SELECT /*+ RESULT_CACHE */ object_type
+    FROM all_objects
+    WHERE owner = :owner
+    AND object_name = :table_name
+    AND object_type IN ('TABLE', 'VIEW')
+"""
+
+# Get column information using result cache and index hints
+_COLUMNS_SQL = """
+    SELECT /*+ RESULT_CACHE INDEX(atc) */
+        column_name, data_type, nullable
+    FROM all_tab_columns atc
+    WHERE owner = :owner AND table_name = :table_name
+    ORDER BY column_id
+"""
+
+# Outgoing and incoming foreign keys; returns no rows for views
+_RELATIONSHIPS_SQL = """
+    SELECT /*+ RESULT_CACHE */
+        'OUTGOING' AS relationship_direction,
+        acc.column_name AS source_column,
+        rcc.table_name AS referenced_table,
+        rcc.column_name AS referenced_column
+    FROM all_constraints ac
+    JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
+                            AND acc.owner = ac.owner
+    JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
+                            AND rcc.owner = ac.r_owner
+    WHERE ac.constraint_type = 'R'
+    AND ac.owner = :owner
+    AND ac.table_name = :table_name
+
+    UNION ALL
+
+    SELECT /*+ RESULT_CACHE */
+        'INCOMING' AS relationship_direction,
+        rcc.column_name AS source_column,
+        ac.table_name AS referenced_table,
+        acc.column_name AS referenced_column
+    FROM all_constraints ac
+    JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
+                            AND acc.owner = ac.owner
+    JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
+                            AND rcc.owner = ac.r_owner
+    WHERE ac.constraint_type = 'R'
+    AND ac.r_owner = :owner
+    AND ac.r_constraint_name IN (
+        SELECT constraint_name
+        FROM all_constraints
+        WHERE owner = :owner
+        AND table_name = :table_name
+        AND constraint_type IN ('P', 'U')
+    )
+"""
+
+# One row per constraint column, with the matching referenced column for foreign
+# keys; ordered so each constraint's rows are contiguous
+_CONSTRAINTS_SQL = """
+    SELECT ac.table_name,
+           ac.constraint_name,
+           ac.constraint_type,
+           ac.search_condition,
+           acc.column_name,
+           rac.table_name AS referenced_table,
+           rcc.column_name AS referenced_column
+    FROM all_constraints ac
+    LEFT JOIN all_cons_columns acc ON acc.owner = ac.owner
+                                  AND acc.constraint_name = ac.constraint_name
+    LEFT JOIN all_constraints rac ON rac.owner = ac.r_owner
+                                 AND rac.constraint_name = ac.r_constraint_name
+    LEFT JOIN all_cons_columns rcc ON rcc.owner = rac.owner
+                                  AND rcc.constraint_name = rac.constraint_name
+                                  AND rcc.position = acc.position
+    WHERE ac.owner = :owner
+    {table_filter}
+    ORDER BY ac.table_name, ac.constraint_name, acc.position
+"""
+
+# Objects of the schema by type and optional name pattern, with dates formatted on the
+# server; type_filter compares object_type with one type or a collection of them
+_PLSQL_OBJECTS_SQL = """
+    SELECT object_name, object_type, status,
+           TO_CHAR(created, 'YYYY-MM-DD HH24:MI:SS') AS created,
+           TO_CHAR(last_ddl_time, 'YYYY-MM-DD HH24:MI:SS') AS last_modified
+    FROM all_objects
+    WHERE owner = :owner
+    AND object_type {type_filter}
+    AND (:name_pattern IS NULL OR object_name LIKE :name_pattern)
+    ORDER BY object_type, object_name
+"""
+
+# One row per index column
+_INDEXES_SQL = """
+    SELECT ai.table_name,
+           ai.index_name,
+           ai.uniqueness,
+           ai.tablespace_name,
+           ai.status,
+           aic.column_name
+    FROM all_indexes ai
+    LEFT JOIN all_ind_columns aic ON aic.index_owner = ai.owner
+                                 AND aic.index_name = ai.index_name
+    WHERE ai.owner = :owner
+    {table_filter}
+    ORDER BY ai.table_name, ai.index_name, aic.column_position
+"""
+
 class DatabaseConnector:
-    def __init__(self, connection_string: str, target_schema: Optional[str] = None, use_thick_mode: bool = False, lib_dir: Optional[str] = None):
+    def __init__(self, connection_string: str, target_schema: Optional[str] = None, use_thick_mode: bool = False, lib_dir: Optional[str] = None,
+                 pool_min: int = 2, pool_max: int = 20, pool_increment: int = 2, pool_burst_max: int = 40,
+                 call_timeout_ms: int = 30000):
         self.connection_string = connection_string
+        # Upper bound for any single database round trip; 0 disables it
+        self.call_timeout_ms = call_timeout_ms
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+        self.pool_increment = pool_increment
+        # Upper bound on pooled plus standalone connections open at the same time
+        self.pool_burst_max = max(pool_burst_max, pool_max)
+        self._burst_connections: Set[Any] = set()
+        # Burst slots taken, counted before connecting so concurrent callers can't overshoot
+        self._burst_reserved = 0
+        # Filled by preload_schema_metadata(); None means query per table
+        self._constraints_by_table: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._indexes_by_table: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        # Tables the preload covered, and when it ran; others are queried per table
+        self._preloaded_tables: Set[str] = set()
+        self._preloaded_at = 0.0
+        # Cleared the first time UTL_MATCH turns out to be unavailable
+        self._server_similarity = True
+        # (schema, object kind) -> (fetched at, names), see NAME_CACHE_TTL
+        self._name_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+        # Normalized query text -> (cached at, explain_query_plan result), least
+        # recently used first; see PLAN_CACHE_TTL
+        self._plan_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
         self.schema_manager: Optional[SchemaManager] = None  # Will be set by DatabaseContext
-        self.target_schema: Optional[str] = target_schema
+        self.target_schema: Optional[str] = target_schema.upper() if target_schema else None
+        # Resolved once; the schema cannot change for the lifetime of the connector
+        self._effective_schema: Optional[str] = self.target_schema
         self.thick_mode = use_thick_mode
         self._pool = None
         self._pool_lock = asyncio.Lock()
@@ -30,56 +285,133 @@ class DatabaseConnector:
 
     async def initialize_pool(self):
         """Initialize the connection pool"""
+        # Fast path: once the pool exists no lock is needed
+        if self._pool is not None:
+            return
         async with self._pool_lock:
-            if self._pool is None:
+            if self._pool is not None:
+                return
+            try:
+                if self.thick_mode:
+                    pool = oracledb.create_pool(
+                        self.connection_string,
+                        min=self.pool_min,
+                        max=self.pool_max,
+                        increment=self.pool_increment,
+                        getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                        wait_timeout=POOL_WAIT_TIMEOUT_MS,
+                        stmtcachesize=STATEMENT_CACHE_SIZE
+                    )
+                else:
+                    pool = oracledb.create_pool_async(
+                        self.connection_string,
+                        min=self.pool_min,
+                        max=self.pool_max,
+                        increment=self.pool_increment,
+                        getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                        wait_timeout=POOL_WAIT_TIMEOUT_MS,
+                        stmtcachesize=STATEMENT_CACHE_SIZE
+                    )
+                # Publish only a fully constructed pool
+                self._pool = pool
+                print("Database connection pool initialized", file=sys.stderr)
+            except Exception as e:
+                print(f"Error creating connection pool: {e}", file=sys.stderr)
+                raise
+            
+            # The connecting user is the same for every pooled session, so
+            # resolve it once here instead of on each request
+            if self._effective_schema is None:
+                conn = await self.get_connection()
                 try:
-                    if self.thick_mode:
-                        self._pool = oracledb.create_pool(
-                            self.connection_string,
-                            min=2,
-                            max=10,
-                            increment=1,
-                            getmode=oracledb.POOL_GETMODE_WAIT
-                        )
-                    else:
-                        self._pool = oracledb.create_pool_async(
-                            self.connection_string,
-                            min=2,
-                            max=10,
-                            increment=1,
-                            getmode=oracledb.POOL_GETMODE_WAIT
-                        )
-                    print("Database connection pool initialized", file=sys.stderr)
-                except Exception as e:
-                    print(f"Error creating connection pool: {e}", file=sys.stderr)
-                    raise
+                    self._effective_schema = conn.username.upper()
+                finally:
+                    await self._close_connection(conn)
 
     async def get_connection(self):
-        """Get a connection from the pool"""
-        if self._pool is None:
+        """Get a connection from the pool.
+
+        Waits up to POOL_WAIT_TIMEOUT_MS for a pooled connection, then opens a burst
+        connection if capacity remains, and otherwise raises QueryTimeoutError.
+        """
+        pool = self._pool
+        if pool is None:
             await self.initialize_pool()
+            pool = self._pool
             
         try:
             if self.thick_mode:
-                return self._pool.acquire()
+                # The timed wait blocks, so keep it off the event loop; otherwise no
+                # other coroutine could release a connection while this one waits
+                conn = await asyncio.to_thread(pool.acquire)
             else:
-                return await self._pool.acquire()
+                conn = await pool.acquire()
+            conn.call_timeout = self.call_timeout_ms
+            return conn
+        except oracledb.Error as e:
+            error_obj, = e.args
+            if error_obj.full_code not in POOL_TIMEOUT_ERRORS:
+                print(f"Error acquiring connection from pool: {e}", file=sys.stderr)
+                raise
+            pool_timeout = e
         except Exception as e:
             print(f"Error acquiring connection from pool: {e}", file=sys.stderr)
             raise
+        
+        # Pool exhausted: open a temporary connection while burst capacity remains,
+        # otherwise give up rather than queue forever
+        if pool.max + self._burst_reserved < self.pool_burst_max:
+            self._burst_reserved += 1
+            return await self._open_burst_connection()
+        raise QueryTimeoutError(*pool_timeout.args) from pool_timeout
 
-    async def _close_connection(self, conn):
-        """Return connection to the pool"""
+    async def _open_burst_connection(self):
+        """Open a standalone connection beyond the pool maximum; it is closed on release.
+
+        The caller must already have reserved a burst slot; it is given back on failure.
+        """
         try:
             if self.thick_mode:
+                conn = await asyncio.to_thread(oracledb.connect, self.connection_string,
+                                               stmtcachesize=STATEMENT_CACHE_SIZE)
+            else:
+                conn = await oracledb.connect_async(self.connection_string, stmtcachesize=STATEMENT_CACHE_SIZE)
+        except BaseException as e:
+            self._burst_reserved -= 1
+            print(f"Error opening burst connection: {e}", file=sys.stderr)
+            raise
+        conn.call_timeout = self.call_timeout_ms
+        self._burst_connections.add(conn)
+        return conn
+
+    async def _close_connection(self, conn):
+        """Return connection to the pool, or close it if it was a burst connection"""
+        try:
+            if conn in self._burst_connections:
+                await self._close_burst_connection(conn)
+            elif self.thick_mode:
                 self._pool.release(conn)
             else:
                 await self._pool.release(conn)
-        except Exception as e:
-            print(f"Error releasing connection to pool: {e}", file=sys.stderr)
+        except Exception:
+            logger.exception("Error releasing connection to pool")
+
+    async def _close_burst_connection(self, conn) -> None:
+        """Close a burst connection and give its slot back"""
+        self._burst_connections.discard(conn)
+        self._burst_reserved -= 1
+        if self.thick_mode:
+            conn.close()
+        else:
+            await conn.close()
 
     async def close_pool(self):
-        """Close the connection pool"""
+        """Close the connection pool and any burst connections still open"""
+        for conn in list(self._burst_connections):
+            try:
+                await self._close_burst_connection(conn)
+            except Exception as e:
+                print(f"Error closing burst connection: {e}", file=sys.stderr)
         if self._pool:
             try:
                 if self.thick_mode:
@@ -95,43 +427,87 @@ class DatabaseConnector:
         """Set the schema manager reference"""
         self.schema_manager = schema_manager
 
-    async def _execute_cursor(self, cursor, sql: str, **params):
+    def _tune_cursor(self, cursor, arraysize: int) -> None:
+        """Size the fetch buffers so large dictionary queries need fewer round trips"""
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = arraysize + 1
+
+    def _raise_if_timeout(self, e: oracledb.Error) -> None:
+        """Re-raise call and network timeouts as QueryTimeoutError.
+
+        Pool acquire timeouts are converted by get_connection(), which first tries
+        to open a burst connection.
+        """
+        error_obj, = e.args
+        if getattr(error_obj, "full_code", None) in TIMEOUT_ERRORS:
+            raise QueryTimeoutError(*e.args) from e
+
+    async def _execute_cursor(self, cursor, sql: str, arraysize: int = DEFAULT_ARRAYSIZE, **params):
         """Helper method to execute cursor operations based on mode"""
-        if self.thick_mode:
-            cursor.execute(sql, **params)  # Synchronous execution
-            return cursor.fetchall()
-        else:
-            await cursor.execute(sql, **params)  # Async execution
-            return await cursor.fetchall()
+        await self._execute_cursor_no_fetch(cursor, sql, arraysize=arraysize, **params)
+        return await self._fetchall(cursor)
 
-    async def _execute_cursor_no_fetch(self, cursor, sql: str, **params):
+    async def _fetchall(self, cursor) -> List[Tuple]:
+        """Fetch all remaining rows of an executed cursor based on mode"""
+        try:
+            if self.thick_mode:
+                return cursor.fetchall()  # Synchronous fetch
+            else:
+                return await cursor.fetchall()  # Async fetch
+        except oracledb.Error as e:
+            self._raise_if_timeout(e)
+            raise
+
+    async def _execute_cursor_no_fetch(self, cursor, sql: str, arraysize: int = DEFAULT_ARRAYSIZE, **params):
         """Helper method for cursor operations that don't need fetching (e.g. DELETE, UPDATE)"""
-        if self.thick_mode:
-            cursor.execute(sql, **params)
-        else:
-            await cursor.execute(sql, **params)
+        self._tune_cursor(cursor, arraysize)
+        try:
+            if self.thick_mode:
+                cursor.execute(sql, **params)  # Synchronous execution
+            else:
+                await cursor.execute(sql, **params)  # Async execution
+        except oracledb.Error as e:
+            self._raise_if_timeout(e)
+            raise
 
-    async def _commit(self, conn):
-        """Commit the current transaction"""
-        if self.thick_mode:
-            conn.commit()
-        else:         
-            await conn.commit()
+    async def _iter_rows(self, cursor) -> AsyncIterator[Tuple]:
+        """Yield rows of an executed cursor as they arrive, one fetch batch at a time"""
+        try:
+            if self.thick_mode:
+                for row in cursor:
+                    yield row
+            else:
+                async for row in cursor:
+                    yield row
+        except oracledb.Error as e:
+            self._raise_if_timeout(e)
+            raise
 
+    async def _execute_cursor_iter(self, cursor, sql: str, arraysize: int = DEFAULT_ARRAYSIZE,
+                                   **params) -> AsyncIterator[Tuple]:
+        """Execute a query and stream its rows instead of materializing them with fetchall()"""
+        await self._execute_cursor_no_fetch(cursor, sql, arraysize=arraysize, **params)
+        async for row in self._iter_rows(cursor):
+            yield row
 
     async def _get_effective_schema(self, conn) -> str:
         """Get the effective schema to use (either target_schema or connection user)"""
-        if self.target_schema:
-            return self.target_schema.upper()
-        return conn.username.upper()
+        if self._effective_schema is None:
+            self._effective_schema = conn.username.upper()
+        return self._effective_schema
 
     async def get_effective_schema(self) -> str:
         """Get the effective schema name (either target_schema or connection user)"""
-        conn = await self.get_connection()
-        try:
-            return await self._get_effective_schema(conn)
-        finally:
-            await self._close_connection(conn)
+        if self._effective_schema is None:
+            # Pool creation resolves the connecting user
+            await self.initialize_pool()
+        if self._effective_schema is None:
+            conn = await self.get_connection()
+            try:
+                return await self._get_effective_schema(conn)
+            finally:
+                await self._close_connection(conn)
+        return self._effective_schema
 
     async def get_database_info(self) -> Dict[str, Any]:
         """Get information about the database vendor and version"""
@@ -184,29 +560,100 @@ class DatabaseConnector:
                     raise
             raise
 
-    def _calculate_similarity(self, s1: str, s2: str) -> float:
-        """Calculate similarity between two strings using SequenceMatcher"""
-        return SequenceMatcher(None, s1.upper(), s2.upper()).ratio()
+    async def _iter_with_fallback(self, cursor, all_query: str, user_query: str,
+                                  **params) -> AsyncIterator[Tuple]:
+        """Stream query rows from ALL_* views, falling back to USER_* views if needed"""
+        try:
+            # Try ALL_* views first
+            await self._execute_cursor_no_fetch(cursor, all_query, **params)
+        except oracledb.DatabaseError as e:
+            error_obj, = e.args
+            if error_obj.code != 1031:  # ORA-01031: insufficient privileges
+                raise
+            print("Permission denied for ALL_* views, trying USER_* views", file=sys.stderr)
+            # Try USER_* views as fallback
+            try:
+                await self._execute_cursor_no_fetch(cursor, user_query, **params)
+            except oracledb.DatabaseError as e2:
+                error_obj2, = e2.args
+                if error_obj2.code == 1031:
+                    print("No access to dictionary views", file=sys.stderr)
+                    return
+                raise
+        
+        async for row in self._iter_rows(cursor):
+            yield row
 
     def _filter_by_similarity(self, items: List[str], search_term: str, 
-                            threshold: float = 0.65) -> List[Tuple[str, float]]:
-        """Client-side fuzzy matching to replace UTL_MATCH"""
-        results = []
+                            threshold: float = SIMILARITY_THRESHOLD,
+                            limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Client-side fuzzy matching, used when UTL_MATCH is not available to the user"""
         search_upper = search_term.upper()
         
-        for item in items:
-            # Direct substring match first
-            if search_upper in item.upper():
-                results.append((item, 1.0))
-            else:
-                # Calculate similarity
-                similarity = self._calculate_similarity(item, search_term)
-                if similarity >= threshold:
-                    results.append((item, similarity))
-        
-        # Sort by similarity descending
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results
+        if HAS_RAPIDFUZZ:
+            # Direct substring matches always rank first; stop scanning once `limit`
+            # of them are found since nothing else can make the cut
+            substring_hits = list(islice((item for item in items if search_upper in item.upper()), limit))
+            if limit is not None and len(substring_hits) >= limit:
+                return [(item, 1.0) for item in substring_hits]
+            hit_set = set(substring_hits)
+            
+            # Native scorer; fuzz.ratio is the same 2*LCS/total measure as the fallback.
+            # The cutoff and limit let RapidFuzz drop weak candidates without
+            # handing them back to Python, and the result comes back sorted.
+            matches = process.extract(
+                search_upper,
+                items,
+                scorer=fuzz.ratio,
+                processor=str.upper,
+                score_cutoff=threshold * 100,
+                limit=None if limit is None else limit + len(hit_set)
+            )
+            results = [(item, 1.0) for item in substring_hits]
+            results.extend((item, score / 100) for item, score, _ in matches if item not in hit_set)
+            return results[:limit]
+        else:
+            # Bit masks of the search term are built once and reused for every name
+            term_masks = _char_masks(search_upper)
+            term_len = len(search_upper)
+            
+            def scored():
+                for item in items:
+                    item_upper = item.upper()
+                    # Direct substring match first
+                    if search_upper in item_upper:
+                        yield (item, 1.0)
+                        continue
+                    # The score can never exceed 2*min(len)/total, so names whose length is
+                    # too far from the term's are rejected without scoring
+                    item_len = len(item_upper)
+                    if 2 * min(item_len, term_len) < threshold * (item_len + term_len):
+                        continue
+                    similarity = 2 * _lcs_length(term_masks, term_len, item_upper) / (item_len + term_len)
+                    if similarity >= threshold:
+                        yield (item, similarity)
+            
+            # Keep only the best `limit` matches in a bounded heap instead of sorting
+            # every match; both orderings are stable by similarity descending
+            if limit is not None:
+                return heapq.nlargest(limit, scored(), key=lambda x: x[1])
+            return sorted(scored(), key=lambda x: x[1], reverse=True)
+
+    def _get_cached_names(self, schema: str) -> Optional[List[str]]:
+        """Return the cached table/view names of a schema if they are still fresh"""
+        entry = self._name_cache.get((schema, 'TABLE_VIEW'))
+        if entry is None or time.monotonic() - entry[0] >= NAME_CACHE_TTL:
+            return None
+        return entry[1]
+
+    def _set_cached_names(self, schema: str, names: List[str]) -> None:
+        """Remember the table/view names of a schema"""
+        self._name_cache[(schema, 'TABLE_VIEW')] = (time.monotonic(), names)
+
+    def invalidate_cache(self) -> None:
+        """Forget cached object name lists and explain plans, e.g. after DDL changes"""
+        self._name_cache.clear()
+        self._plan_cache.clear()
 
     async def get_all_table_names(self) -> Set[str]:
         """Get a list of all table and view names in the database with permission handling"""
@@ -233,21 +680,42 @@ class DatabaseConnector:
                 ORDER BY object_name
             """
             
-            # Execute with fallback
-            objects = await self._execute_with_fallback(
-                cursor,
-                all_objects_query,
-                user_objects_query,
-                owner=schema
-            )
+            # Stream names with fallback, never holding the full row list in memory
+            objects = {
+                obj[0] async for obj in self._iter_with_fallback(
+                    cursor,
+                    all_objects_query,
+                    user_objects_query,
+                    arraysize=LARGE_ARRAYSIZE,
+                    owner=schema
+                )
+            }
             
             if not objects:
                 print("Warning: Could not retrieve any tables or views. Check permissions.", file=sys.stderr)
             
-            return {obj[0] for obj in objects}
+            self._set_cached_names(schema, list(objects))
+            return objects
         finally:
             await self._close_connection(conn)
     
+    async def _execute_ref_cursors(self, cursor, plsql: str, cursor_names: List[str],
+                                   arraysize: int = DEFAULT_ARRAYSIZE, **params) -> List[List[Tuple]]:
+        """Execute a PL/SQL block that opens several OUT ref cursors and fetch them all.
+
+        All statements are run by the server in a single round trip; the returned
+        lists follow the order of ``cursor_names``.
+        """
+        out_vars = {name: cursor.var(oracledb.DB_TYPE_CURSOR) for name in cursor_names}
+        await self._execute_cursor_no_fetch(cursor, plsql, **params, **out_vars)
+        
+        results = []
+        for name in cursor_names:
+            ref_cursor = out_vars[name].getvalue()
+            self._tune_cursor(ref_cursor, arraysize)
+            results.append(await self._fetchall(ref_cursor))
+        return results
+
     async def load_table_details(self, table_name: str) -> Optional[Dict[str, Any]]:
         """Load detailed schema information for a specific table or view with optimized queries"""
         conn = await self.get_connection()
@@ -255,111 +723,51 @@ class DatabaseConnector:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            # Check if the object exists and get its type
-            object_check_query = """
-                SELECT /*+ RESULT_CACHE */ object_type 
-                FROM all_objects 
-                WHERE owner = :owner 
-                AND object_name = :object_name
-                AND object_type IN ('TABLE', 'VIEW')
-            """
-            
-            # Fallback query for USER objects
-            user_object_check_query = """
-                SELECT 'TABLE' AS object_type FROM user_tables WHERE table_name = :object_name
-                UNION ALL
-                SELECT 'VIEW' AS object_type FROM user_views WHERE view_name = :object_name
-            """
-            
-            object_info = await self._execute_with_fallback(
-                cursor,
-                object_check_query,
-                user_object_check_query,
-                owner=schema,
-                object_name=table_name.upper()
-            )
+            # Object type, columns and relationships are opened as ref cursors of a
+            # single PL/SQL block so the whole lookup costs one round trip
+            try:
+                object_info, columns, relationships = await self._execute_ref_cursors(
+                    cursor,
+                    f"""
+                    BEGIN
+                        OPEN :obj_cur FOR {_OBJECT_TYPE_SQL};
+                        OPEN :cols_cur FOR {_COLUMNS_SQL};
+                        OPEN :rels_cur FOR {_RELATIONSHIPS_SQL};
+                    END;
+                    """,
+                    ["obj_cur", "cols_cur", "rels_cur"],
+                    arraysize=SMALL_ARRAYSIZE,
+                    owner=schema,
+                    table_name=table_name.upper()
+                )
+            except QueryTimeoutError:
+                raise
+            except oracledb.DatabaseError as e:
+                # Missing privileges on the ALL_* views surface as a compile error of the
+                # block (ORA-06550 wrapping ORA-01031/ORA-00942), so any other failure
+                # falls back to separate queries, which also try the USER_* views
+                print(f"Batched table lookup failed, querying separately: {e}", file=sys.stderr)
+                object_info, columns, relationships = await self._load_table_details_separately(
+                    cursor, schema, table_name.upper()
+                )
             
             if not object_info:
                 return None
             
             object_type = object_info[0][0]
-                
-            # Get column information using result cache and index hints
-            columns = await self._execute_cursor(
-                cursor,
-                """
-                SELECT /*+ RESULT_CACHE INDEX(atc) */ 
-                    column_name, data_type, nullable
-                FROM all_tab_columns atc
-                WHERE owner = :owner AND table_name = :table_name
-                ORDER BY column_id
-                """,
-                owner=schema, 
-                table_name=table_name.upper()
-            )
             
-            column_info = []
-            for column, data_type, nullable in columns:
-                column_info.append({
-                    "name": column,
-                    "type": data_type,
-                    "nullable": nullable == 'Y'
-                })
+            column_info = [
+                {"name": column, "type": data_type, "nullable": nullable == 'Y'}
+                for column, data_type, nullable in columns
+            ]
             
-            # Get relationship information only for tables (views don't have FK constraints)
-            relationship_info = {}
+            # Relationship information only applies to tables (views don't have FK constraints)
+            relationship_info: Dict[str, List[Dict[str, Any]]] = {}
             if object_type == 'TABLE':
-                relationships = await self._execute_cursor(
-                    cursor,
-                    """
-                    SELECT /*+ RESULT_CACHE */
-                        'OUTGOING' AS relationship_direction,
-                        acc.column_name AS source_column,
-                        rcc.table_name AS referenced_table,
-                        rcc.column_name AS referenced_column
-                    FROM all_constraints ac
-                    JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
-                                            AND acc.owner = ac.owner
-                    JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
-                                            AND rcc.owner = ac.r_owner
-                    WHERE ac.constraint_type = 'R'
-                    AND ac.owner = :owner
-                    AND ac.table_name = :table_name
-
-                    UNION ALL
-
-                    SELECT /*+ RESULT_CACHE */
-                        'INCOMING' AS relationship_direction,
-                        rcc.column_name AS source_column,
-                        ac.table_name AS referenced_table,
-                        acc.column_name AS referenced_column
-                    FROM all_constraints ac
-                    JOIN all_cons_columns acc ON acc.constraint_name = ac.constraint_name
-                                            AND acc.owner = ac.owner
-                    JOIN all_cons_columns rcc ON rcc.constraint_name = ac.r_constraint_name
-                                            AND rcc.owner = ac.r_owner
-                    WHERE ac.constraint_type = 'R'
-                    AND ac.r_owner = :owner
-                    AND ac.r_constraint_name IN (
-                        SELECT constraint_name 
-                        FROM all_constraints
-                        WHERE owner = :owner
-                        AND table_name = :table_name
-                        AND constraint_type IN ('P', 'U')
-                    )
-                    """,
-                    owner=schema, 
-                    table_name=table_name.upper()
-                )
-                
                 for direction, column, ref_table, ref_column in relationships:
-                    if ref_table not in relationship_info:
-                        relationship_info[ref_table] = []
-                    relationship_info[ref_table].append({
-                        "local_column": column,
-                        "foreign_column": ref_column,
-                        "direction": direction
-                    })
+                    relationship_info.setdefault(ref_table, []).append(
+                        {"local_column": column, "foreign_column": ref_column, "direction": direction}
+                    )
                 
             return {
                 "object_type": object_type,
@@ -372,7 +780,60 @@ class DatabaseConnector:
             raise
         finally:
             await self._close_connection(conn)
-    
+
+    async def load_tables_bulk(self, table_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Load details for several tables concurrently, one pooled connection per table"""
+        await self.initialize_pool()
+        sem = asyncio.Semaphore(self._pool.max)
+        
+        async def _one(table_name: str) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return await self.load_table_details(table_name)
+        
+        details = await asyncio.gather(*[_one(name) for name in table_names])
+        return dict(zip(table_names, details))
+
+    async def _load_table_details_separately(self, cursor, schema: str,
+                                             table_name: str) -> Tuple[List[Tuple], List[Tuple], List[Tuple]]:
+        """Run the table detail queries one by one, falling back to USER_* views where needed"""
+        # Fallback query for USER objects
+        user_object_check_query = """
+            SELECT 'TABLE' AS object_type FROM user_tables WHERE table_name = :table_name
+            UNION ALL
+            SELECT 'VIEW' AS object_type FROM user_views WHERE view_name = :table_name
+        """
+        
+        object_info = await self._execute_with_fallback(
+            cursor,
+            _OBJECT_TYPE_SQL,
+            user_object_check_query,
+            owner=schema,
+            table_name=table_name
+        )
+        
+        if not object_info:
+            return [], [], []
+        
+        columns = await self._execute_cursor(
+            cursor,
+            _COLUMNS_SQL,
+            arraysize=SMALL_ARRAYSIZE,
+            owner=schema,
+            table_name=table_name
+        )
+        
+        relationships = []
+        if object_info[0][0] == 'TABLE':
+            relationships = await self._execute_cursor(
+                cursor,
+                _RELATIONSHIPS_SQL,
+                arraysize=SMALL_ARRAYSIZE,
+                owner=schema,
+                table_name=table_name
+            )
+        
+        return object_info, columns, relationships
+
     async def get_pl_sql_objects(self, object_type: str, name_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get PL/SQL objects"""
         conn = await self.get_connection()
@@ -380,41 +841,60 @@ class DatabaseConnector:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            where_clause = "WHERE owner = :owner AND object_type = :object_type"
-            params = {"owner": schema, "object_type": object_type}
-            
-            if name_pattern:
-                where_clause += " AND object_name LIKE :name_pattern"
-                params["name_pattern"] = name_pattern.upper()
-            
-            objects = await self._execute_cursor(cursor, f"""
-                SELECT object_name, object_type, status, created, last_ddl_time
-                FROM all_objects
-                {where_clause}
-                ORDER BY object_name
-            """, **params)
-            
-            result = []
-            
-            for name, obj_type, status, created, last_modified in objects:
-                obj_info = {
-                    "name": name,
-                    "type": obj_type,
-                    "status": status,
-                    "owner": schema
-                }
-                
-                if created:
-                    obj_info["created"] = created.strftime("%Y-%m-%d %H:%M:%S")
-                if last_modified:
-                    obj_info["last_modified"] = last_modified.strftime("%Y-%m-%d %H:%M:%S")
-                
-                result.append(obj_info)
+            # Constant SQL text so every call hits the statement cache
+            objects = await self._execute_cursor(
+                cursor,
+                _PLSQL_OBJECTS_SQL.format(type_filter="= :object_type"),
+                owner=schema,
+                object_type=object_type,
+                name_pattern=name_pattern.upper() if name_pattern else None
+            )
+            return self._fold_plsql_objects(schema, objects)
+        finally:
+            await self._close_connection(conn)
+    
+    async def get_pl_sql_objects_bulk(self, object_types: List[str],
+                                      name_pattern: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get PL/SQL objects of several types with a single query"""
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
             
-            return result
+            # The types travel as one collection bind, so the SQL text never varies
+            objects = await self._execute_cursor(
+                cursor,
+                _PLSQL_OBJECTS_SQL.format(type_filter="IN (SELECT column_value FROM TABLE(:object_types))"),
+                owner=schema,
+                object_types=await self._string_list(conn, [t.upper() for t in object_types]),
+                name_pattern=name_pattern.upper() if name_pattern else None
+            )
+            return self._fold_plsql_objects(schema, objects)
         finally:
             await self._close_connection(conn)
     
+    def _fold_plsql_objects(self, schema: str, rows: List[Tuple]) -> List[Dict[str, Any]]:
+        """Turn PL/SQL object rows into dicts; dates arrive already formatted by the server"""
+        return [
+            {
+                "name": name,
+                "type": obj_type,
+                "status": status,
+                "owner": schema,
+                **({"created": created} if created else {}),
+                **({"last_modified": last_modified} if last_modified else {})
+            }
+            for name, obj_type, status, created, last_modified in rows
+        ]
+    
+    async def _string_list(self, conn, values: List[str]):
+        """Build a SYS.ODCIVARCHAR2LIST collection to bind a list of strings"""
+        if self.thick_mode:
+            list_type = conn.gettype("SYS.ODCIVARCHAR2LIST")
+        else:
+            list_type = await conn.gettype("SYS.ODCIVARCHAR2LIST")
+        return list_type.newobject(values)
+    
     async def get_object_source(self, object_type: str, object_name: str) -> str:
         """Get the source code for a PL/SQL object"""
         conn = await self.get_connection()
@@ -425,21 +905,21 @@ class DatabaseConnector:
             # Handle different object types accordingly
             if object_type in ('PACKAGE', 'PACKAGE BODY', 'TYPE', 'TYPE BODY'):
                 # For packages and types, we need to get the full source
-                source_lines = await self._execute_cursor(cursor, """
+                source_lines = [line[0] async for line in self._execute_cursor_iter(cursor, """
                     SELECT text
                     FROM all_source
                     WHERE owner = :owner 
                     AND name = :name 
                     AND type = :type
                     ORDER BY line
-                """, owner=schema, name=object_name, type=object_type)
-                
-                if not source_lines:
-                    return ""
+                """, arraysize=LARGE_ARRAYSIZE, owner=schema, name=object_name, type=object_type)]
                 
-                return "\n".join(line[0] for line in source_lines)
+                return "\n".join(source_lines)
             else:
                 # For procedures, functions, triggers, views, etc.
+                # Deliver the DDL CLOB inline as a string instead of a LOB locator
+                # that would need another round trip to read
+                cursor.outputtypehandler = self._clob_as_string
                 result = await self._execute_cursor(cursor, """
                     SELECT dbms_metadata.get_ddl(
                         :object_type, 
@@ -454,9 +934,7 @@ class DatabaseConnector:
                 if not result or not result[0]:
                     return ""
                     
-                # Properly await the CLOB read operation
-                clob = result[0][0]
-                return await clob.read()
+                return result[0][0] or ""
                 
         except oracledb.Error as e:
             print(f"Error getting object source: {str(e)}", file=sys.stderr)
@@ -464,131 +942,188 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
     
+    @staticmethod
+    def _clob_as_string(cursor, metadata):
+        """Output type handler that fetches CLOB columns directly as str"""
+        if metadata.type_code is oracledb.DB_TYPE_CLOB:
+            return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+        return None
+    
     async def get_table_constraints(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table constraints"""
+        if self._is_preloaded(table_name):
+            return self._constraints_by_table.get(table_name.upper(), [])
+        
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            # Get all constraints for the table
-            constraints = await self._execute_cursor(cursor, """
-                SELECT ac.constraint_name,
-                       ac.constraint_type,
-                       ac.search_condition
-                FROM all_constraints ac
-                WHERE ac.owner = :owner
-                AND ac.table_name = :table_name
-            """, owner=schema, table_name=table_name.upper())
-            
-            result = []
-            
-            for constraint_name, constraint_type, condition in constraints:
-                # Map constraint type codes to descriptions
-                type_map = {
-                    'P': 'PRIMARY KEY',
-                    'R': 'FOREIGN KEY',
-                    'U': 'UNIQUE',
-                    'C': 'CHECK'
-                }
-                
-                constraint_info = {
-                    "name": constraint_name,
-                    "type": type_map.get(constraint_type, constraint_type)
-                }
-                
-                # Get columns involved in this constraint
-                columns = await self._execute_cursor(cursor, """
-                    SELECT column_name
-                    FROM all_cons_columns
-                    WHERE owner = :owner
-                    AND constraint_name = :constraint_name
-                    ORDER BY position
-                """, owner=schema, constraint_name=constraint_name)
-                
-                constraint_info["columns"] = [col[0] for col in columns]
-                
-                # If it's a foreign key, get the referenced table/columns
-                if constraint_type == 'R':
-                    ref_info = await self._execute_cursor(cursor, """
-                        SELECT ac.table_name,
-                               acc.column_name
-                        FROM all_constraints ac
-                        JOIN all_cons_columns acc ON ac.constraint_name = acc.constraint_name
-                        WHERE ac.constraint_name = (
-                            SELECT r_constraint_name
-                            FROM all_constraints
-                            WHERE owner = :owner
-                            AND constraint_name = :constraint_name
-                        )
-                        AND acc.owner = ac.owner
-                        ORDER BY acc.position
-                    """, owner=schema, constraint_name=constraint_name)
-                    
-                    if ref_info:
-                        constraint_info["references"] = {
-                            "table": ref_info[0][0],
-                            "columns": [col[1] for col in ref_info]
-                        }
-                
-                # For check constraints, include the condition
-                if constraint_type == 'C' and condition:
-                    constraint_info["condition"] = condition
-                
-                result.append(constraint_info)
+            rows = await self._execute_cursor(
+                cursor,
+                _CONSTRAINTS_SQL.format(table_filter="AND ac.table_name = :table_name"),
+                owner=schema,
+                table_name=table_name.upper()
+            )
             
-            return result
+            return self._group_constraints(rows).get(table_name.upper(), [])
         finally:
             await self._close_connection(conn)
     
     async def get_table_indexes(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table indexes"""
+        if self._is_preloaded(table_name):
+            return self._indexes_by_table.get(table_name.upper(), [])
+        
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            # Get all indexes for the table
-            indexes = await self._execute_cursor(cursor, """
-                SELECT ai.index_name,
-                       ai.uniqueness,
-                       ai.tablespace_name,
-                       ai.status
-                FROM all_indexes ai
-                WHERE ai.owner = :owner
-                AND ai.table_name = :table_name
-            """, owner=schema, table_name=table_name.upper())
+            rows = await self._execute_cursor(
+                cursor,
+                _INDEXES_SQL.format(table_filter="AND ai.table_name = :table_name"),
+                owner=schema,
+                table_name=table_name.upper()
+            )
             
-            result = []
+            return self._group_indexes(rows).get(table_name.upper(), [])
+        finally:
+            await self._close_connection(conn)
+    
+    async def preload_schema_metadata(self) -> None:
+        """Load constraints and indexes of every table in the schema with one query each.
+
+        Later get_table_constraints/get_table_indexes calls for the tables that existed
+        at preload time are answered from memory for PRELOAD_TTL seconds, or until
+        clear_preloaded_metadata() drops them.
+        """
+        conn = await self.get_connection()
+        try:
+            cursor = conn.cursor()
+            schema = await self._get_effective_schema(conn)
+            
+            constraint_rows = await self._execute_cursor(
+                cursor,
+                _CONSTRAINTS_SQL.format(table_filter=""),
+                arraysize=LARGE_ARRAYSIZE,
+                owner=schema
+            )
+            index_rows = await self._execute_cursor(
+                cursor,
+                _INDEXES_SQL.format(table_filter=""),
+                arraysize=LARGE_ARRAYSIZE,
+                owner=schema
+            )
+            # Tables without any constraint or index are covered too
+            table_rows = await self._execute_cursor(cursor, """
+                SELECT object_name
+                FROM all_objects
+                WHERE owner = :owner
+                AND object_type IN ('TABLE', 'VIEW')
+            """, arraysize=LARGE_ARRAYSIZE, owner=schema)
             
-            for index_name, uniqueness, tablespace, status in indexes:
-                index_info = {
+            self._constraints_by_table = self._group_constraints(constraint_rows)
+            self._indexes_by_table = self._group_indexes(index_rows)
+            self._preloaded_tables = {row[0] for row in table_rows}
+            self._preloaded_at = time.monotonic()
+            print(f"Preloaded constraints and indexes for {len(self._constraints_by_table)} tables", file=sys.stderr)
+        finally:
+            await self._close_connection(conn)
+    
+    def clear_preloaded_metadata(self, table_name: Optional[str] = None) -> None:
+        """Forget preloaded constraints/indexes for one table, or all of them"""
+        if table_name is None:
+            self._constraints_by_table = None
+            self._indexes_by_table = None
+            self._preloaded_tables = set()
+            return
+        name = table_name.upper()
+        self._preloaded_tables.discard(name)
+        if self._constraints_by_table is not None:
+            self._constraints_by_table.pop(name, None)
+        if self._indexes_by_table is not None:
+            self._indexes_by_table.pop(name, None)
+    
+    def _is_preloaded(self, table_name: str) -> bool:
+        """Whether a table's constraints/indexes can be answered from the preload"""
+        if self._constraints_by_table is None or self._indexes_by_table is None:
+            return False
+        if time.monotonic() - self._preloaded_at >= PRELOAD_TTL:
+            self.clear_preloaded_metadata()
+            return False
+        return table_name.upper() in self._preloaded_tables
+    
+    def _group_constraints(self, rows: List[Tuple]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fold one-row-per-column constraint rows into constraint dicts per table"""
+        # Map constraint type codes to descriptions
+        type_map = {
+            'P': 'PRIMARY KEY',
+            'R': 'FOREIGN KEY',
+            'U': 'UNIQUE',
+            'C': 'CHECK'
+        }
+        
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        current: Optional[Dict[str, Any]] = None
+        current_key = None
+        
+        for table_name, constraint_name, constraint_type, condition, column, ref_table, ref_column in rows:
+            if (table_name, constraint_name) != current_key:
+                current_key = (table_name, constraint_name)
+                current = {
+                    "name": constraint_name,
+                    "type": type_map.get(constraint_type, constraint_type),
+                    "columns": []
+                }
+                
+                # If it's a foreign key, record the referenced table
+                if constraint_type == 'R' and ref_table:
+                    current["references"] = {
+                        "table": ref_table,
+                        "columns": []
+                    }
+                
+                # For check constraints, include the condition
+                if constraint_type == 'C' and condition:
+                    current["condition"] = condition
+                
+                result.setdefault(table_name, []).append(current)
+            
+            if column:
+                current["columns"].append(column)
+            if ref_column and "references" in current:
+                current["references"]["columns"].append(ref_column)
+        
+        return result
+    
+    def _group_indexes(self, rows: List[Tuple]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fold one-row-per-column index rows into index dicts per table"""
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        current: Optional[Dict[str, Any]] = None
+        current_key = None
+        
+        for table_name, index_name, uniqueness, tablespace, status, column in rows:
+            if (table_name, index_name) != current_key:
+                current_key = (table_name, index_name)
+                current = {
                     "name": index_name,
                     "unique": uniqueness == 'UNIQUE'
                 }
                 
                 if tablespace:
-                    index_info["tablespace"] = tablespace
+                    current["tablespace"] = tablespace
                 
                 if status:
-                    index_info["status"] = status
-                
-                # Get columns in this index
-                columns = await self._execute_cursor(cursor, """
-                    SELECT column_name
-                    FROM all_ind_columns
-                    WHERE index_owner = :owner
-                    AND index_name = :index_name
-                    ORDER BY column_position
-                """, owner=schema, index_name=index_name)
+                    current["status"] = status
                 
-                index_info["columns"] = [col[0] for col in columns]
-                
-                result.append(index_info)
+                current["columns"] = []
+                result.setdefault(table_name, []).append(current)
             
-            return result
-        finally:
-            await self._close_connection(conn)
+            if column:
+                current["columns"].append(column)
+        
+        return result
     
     async def get_dependent_objects(self, object_name: str) -> List[Dict[str, Any]]:
         """Get objects that depend on the specified object"""
@@ -636,19 +1171,15 @@ class DatabaseConnector:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            where_clause = "WHERE owner = :owner"
-            params = {"owner": schema}
-            
-            if type_pattern:
-                where_clause += " AND type_name LIKE :type_pattern"
-                params["type_pattern"] = type_pattern.upper()
-            
-            types = await self._execute_cursor(cursor, f"""
+            # Constant SQL text so every call hits the statement cache
+            types = await self._execute_cursor(cursor, """
                 SELECT type_name, typecode
                 FROM all_types
-                {where_clause}
+                WHERE owner = :owner
+                AND (:type_pattern IS NULL OR type_name LIKE :type_pattern)
                 ORDER BY type_name
-            """, **params)
+            """, owner=schema,
+                type_pattern=type_pattern.upper() if type_pattern else None)
             
             result = []
             
@@ -687,38 +1218,38 @@ class DatabaseConnector:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            # Get tables referenced by this table
-            referenced_tables_result = await self._execute_cursor(cursor, """
-                SELECT /*+ RESULT_CACHE LEADING(ac acc) USE_NL(acc) */
-                    DISTINCT acc.table_name AS referenced_table
+            # Both directions in one statement, tagged so they can be split client-side
+            rows = await self._execute_cursor(cursor, """
+                SELECT /*+ RESULT_CACHE */
+                    'OUT' AS direction,
+                    acc.table_name AS related_table
                 FROM all_constraints ac
                 JOIN all_cons_columns acc ON acc.constraint_name = ac.r_constraint_name
-                    AND acc.owner = ac.owner
+                    AND acc.owner = ac.r_owner
                 WHERE ac.constraint_type = 'R'
                 AND ac.table_name = :table_name
                 AND ac.owner = :owner
-            """, table_name=table_name.upper(), owner=schema)
-            
-            referenced_tables = [row[0] for row in referenced_tables_result]
-            
-            # Get tables that reference this table
-            referencing_tables_result = await self._execute_cursor(cursor, """
-                WITH pk_constraints AS (
-                    SELECT /*+ MATERIALIZE */ constraint_name
+                
+                UNION
+                
+                SELECT /*+ RESULT_CACHE */
+                    'IN' AS direction,
+                    ac.table_name AS related_table
+                FROM all_constraints ac
+                WHERE ac.constraint_type = 'R'
+                AND ac.owner = :owner
+                AND ac.r_constraint_name IN (
+                    SELECT constraint_name
                     FROM all_constraints
-                    WHERE table_name = :table_name
+                    WHERE owner = :owner
+                    AND table_name = :table_name
                     AND constraint_type IN ('P', 'U')
-                    AND owner = :owner
                 )
-                SELECT /*+ RESULT_CACHE LEADING(ac pk) USE_NL(pk) */
-                    DISTINCT ac.table_name AS referencing_table
-                FROM pk_constraints
-                JOIN pk_constraints pk ON ac.r_constraint_name = pk.constraint_name
-                WHERE ac.constraint_type = 'R'
-                AND ac.owner = :owner
+                ORDER BY 2
             """, table_name=table_name.upper(), owner=schema)
             
-            referencing_tables = [row[0] for row in referencing_tables_result]
+            referenced_tables = [table for direction, table in rows if direction == 'OUT']
+            referencing_tables = [table for direction, table in rows if direction == 'IN']
             
             return {
                 'referenced_tables': referenced_tables,
@@ -729,126 +1260,226 @@ class DatabaseConnector:
             await self._close_connection(conn)
     
     async def search_in_database(self, search_term: str, limit: int = 20) -> List[str]:
-        """Search for table and view names in the database using client-side similarity matching"""
+        """Search for table and view names, ranked by similarity on the server when possible"""
+        # With client-side ranking and a fresh name list there is nothing to ask the
+        # database, so answer without borrowing a connection
+        if not self._server_similarity and self._effective_schema is not None:
+            object_names = self._get_cached_names(self._effective_schema)
+            if object_names is not None:
+                return [name for name, _ in self._filter_by_similarity(object_names, search_term, limit=limit)]
+        
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
             
-            # Get all tables and views
-            all_objects_query = """
-                SELECT /*+ RESULT_CACHE */ object_name 
-                FROM all_objects 
-                WHERE owner = :owner 
-                AND object_type IN ('TABLE', 'VIEW')
-            """
-            
-            user_objects_query = """
-                SELECT table_name AS object_name FROM user_tables
-                UNION ALL
-                SELECT view_name AS object_name FROM user_views
-            """
-            
-            # Get all objects with permission fallback
-            all_objects = await self._execute_with_fallback(
-                cursor,
-                all_objects_query,
-                user_objects_query,
-                owner=schema
-            )
-            
-            # Extract object names
-            object_names = [obj[0] for obj in all_objects]
+            if self._server_similarity:
+                try:
+                    # Score and rank on the server so only the top `limit` names travel.
+                    # Bind types are pinned so repeat calls reuse the parsed cursor.
+                    cursor.setinputsizes(owner=oracledb.DB_TYPE_VARCHAR,
+                                         search_term=oracledb.DB_TYPE_VARCHAR,
+                                         min_score=oracledb.DB_TYPE_NUMBER,
+                                         limit=oracledb.DB_TYPE_NUMBER)
+                    await self._execute_cursor_no_fetch(cursor, """
+                        SELECT object_name
+                        FROM (
+                            SELECT object_name, score
+                            FROM (
+                                SELECT object_name,
+                                    CASE
+                                        WHEN INSTR(object_name, :search_term) > 0 THEN 100
+                                        ELSE UTL_MATCH.EDIT_DISTANCE_SIMILARITY(object_name, :search_term)
+                                    END AS score
+                                FROM all_objects
+                                WHERE owner = :owner
+                                AND object_type IN ('TABLE', 'VIEW')
+                            )
+                            WHERE score >= :min_score
+                            ORDER BY score DESC, object_name
+                        )
+                        WHERE ROWNUM <= :limit
+                    """, arraysize=SMALL_ARRAYSIZE,
+                        owner=schema,
+                        search_term=search_term.upper(),
+                        min_score=SIMILARITY_THRESHOLD * 100,
+                        limit=limit)
+                    # Names come from a small closed set; share one string per name
+                    cursor.rowfactory = sys.intern
+                    return await self._fetchall(cursor)
+                except oracledb.DatabaseError as e:
+                    error_obj, = e.args
+                    # ORA-00904/ORA-01031: UTL_MATCH not available to this user
+                    if error_obj.code not in (904, 1031):
+                        raise
+                    print("UTL_MATCH unavailable, using client-side similarity matching", file=sys.stderr)
+                    self._server_similarity = False
+            
+            # Reuse a recent name list instead of re-reading all_objects
+            object_names = self._get_cached_names(schema)
+            if object_names is None:
+                # Get all tables and views
+                all_objects_query = """
+                    SELECT /*+ RESULT_CACHE */ object_name 
+                    FROM all_objects 
+                    WHERE owner = :owner 
+                    AND object_type IN ('TABLE', 'VIEW')
+                """
+                
+                user_objects_query = """
+                    SELECT table_name AS object_name FROM user_tables
+                    UNION ALL
+                    SELECT view_name AS object_name FROM user_views
+                """
+                
+                # Stream names with permission fallback in large fetch batches,
+                # without first materializing the full list of row tuples
+                object_names = [
+                    sys.intern(obj[0]) async for obj in self._iter_with_fallback(
+                        cursor,
+                        all_objects_query,
+                        user_objects_query,
+                        arraysize=DEFAULT_ARRAYSIZE,
+                        owner=schema
+                    )
+                ]
+                self._set_cached_names(schema, object_names)
             
-            # Use client-side similarity matching
-            matched_objects = self._filter_by_similarity(object_names, search_term)
+            # Use client-side similarity matching, keeping only the best `limit` names
+            matched_objects = self._filter_by_similarity(object_names, search_term, limit=limit)
             
-            # Return just the names, limited by the limit parameter
-            return [name for name, _ in matched_objects][:limit]
+            # Return just the names
+            return [name for name, _ in matched_objects]
             
         finally:
             await self._close_connection(conn)
             
-    async def search_columns_in_database(self, table_names: List[str], search_term: str) -> Dict[str, List[Dict[str, Any]]]:
-        """Search for columns in specified tables"""
+    async def search_columns_in_database(self, table_names: List[str], search_term: str,
+                                         limit: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Search for columns in specified tables.
+
+        When ``limit`` is given, column names starting with the term are looked up
+        first, and the contains search only runs if fewer than ``limit`` tables match.
+        """
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             schema = await self._get_effective_schema(conn)
-            result = {}
+            names = sorted(set(table_names))
+            search_term = search_term.upper()
             
-            # Get columns for the specified tables that match the search term
-            rows = await self._execute_cursor(cursor, """
-                SELECT /*+ RESULT_CACHE */ 
-                    table_name,
-                    column_name,
-                    data_type,
-                    nullable
-                FROM all_tab_columns 
-                WHERE owner = :owner
-                AND table_name IN (SELECT column_value FROM TABLE(CAST(:table_names AS SYS.ODCIVARCHAR2LIST)))
-                AND UPPER(column_name) LIKE '%' || :search_term || '%'
-                ORDER BY table_name, column_id
-            """, owner=schema, 
-                table_names=table_names,
-                search_term=search_term.upper())
-            
-            for table_name, column_name, data_type, nullable in rows:
-                if table_name not in result:
-                    result[table_name] = []
-                result[table_name].append({
-                    "name": column_name,
-                    "type": data_type,
-                    "nullable": nullable == 'Y'
-                })
+            # Prefix matches can use the dictionary index on column_name
+            if limit is not None and not search_term.startswith('%'):
+                result = await self._search_columns(conn, cursor, schema, names, search_term,
+                                                    ":search_term || '%'")
+                if len(result) >= limit:
+                    return result
             
-            return result
+            return await self._search_columns(conn, cursor, schema, names, search_term,
+                                              "'%' || :search_term || '%'")
             
         finally:
             await self._close_connection(conn)
     
+    async def _search_columns(self, conn, cursor, schema: str, names: List[str], search_term: str,
+                              pattern: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Find columns of the given tables whose name is LIKE ``pattern``, grouped by table"""
+        result = defaultdict(list)
+        if not names:
+            return {}
+        
+        # Up to the largest bucket, names are bound as a fixed-size IN list so each
+        # size keeps one shared cursor; longer lists (e.g. a whole schema of uncached
+        # tables) go in one collection bind so the search stays a single round trip.
+        # column_name is compared as stored, without UPPER(), so the predicate stays
+        # sargable; callers pass an upper-cased term.
+        if len(names) <= IN_LIST_BUCKETS[-1]:
+            placeholders, name_binds = _in_list_binds(names, "t")
+            table_filter = f"IN ({placeholders})"
+            cursor.setinputsizes(owner=oracledb.DB_TYPE_VARCHAR,
+                                 search_term=oracledb.DB_TYPE_VARCHAR,
+                                 **dict.fromkeys(name_binds, oracledb.DB_TYPE_VARCHAR))
+        else:
+            table_filter = "IN (SELECT column_value FROM TABLE(:table_names))"
+            name_binds = {"table_names": await self._string_list(conn, names)}
+            cursor.setinputsizes(owner=oracledb.DB_TYPE_VARCHAR,
+                                 search_term=oracledb.DB_TYPE_VARCHAR)
+        
+        await self._execute_cursor_no_fetch(cursor, f"""
+            SELECT /*+ RESULT_CACHE */ 
+                table_name,
+                column_name,
+                data_type,
+                nullable
+            FROM all_tab_columns 
+            WHERE owner = :owner
+            AND table_name {table_filter}
+            AND column_name LIKE {pattern}
+            ORDER BY table_name, column_id
+        """, arraysize=COLUMN_SEARCH_ARRAYSIZE,
+            owner=schema,
+            search_term=search_term,
+            **name_binds)
+        # Table and column names repeat across calls; share one string per name
+        cursor.rowfactory = lambda table_name, column_name, data_type, nullable: (
+            sys.intern(table_name), sys.intern(column_name), data_type, nullable)
+        
+        for table_name, column_name, data_type, nullable in await self._fetchall(cursor):
+            result[table_name].append({"name": column_name, "type": data_type, "nullable": nullable == 'Y'})
+        
+        return dict(result)
+    
     async def explain_query_plan(self, query: str) -> Dict[str, Any]:
         """Get execution plan for a SQL query"""
+        cache_key = self._normalize_query(query)
+        cached = self._plan_cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < PLAN_CACHE_TTL:
+                self._plan_cache.move_to_end(cache_key)
+                return dict(cached[1])
+            del self._plan_cache[cache_key]
+        
         conn = await self.get_connection()
         try:
             cursor = conn.cursor()
             
-            # First create an explain plan
-            plan_statement = f"EXPLAIN PLAN FOR {query}"
-            await cursor.execute(plan_statement)
-            
-            # Then retrieve the execution plan with cost and cardinality information
-            plan_rows = await self._execute_cursor(cursor, """
-                SELECT 
-                    LPAD(' ', 2*LEVEL-2) || operation || ' ' || 
-                    options || ' ' || object_name || 
-                    CASE 
-                        WHEN cost IS NOT NULL THEN ' (Cost: ' || cost || ')'
-                        ELSE ''
-                    END || 
-                    CASE 
-                        WHEN cardinality IS NOT NULL THEN ' (Rows: ' || cardinality || ')'
-                        ELSE ''
-                    END as execution_plan_step
-                FROM plan_table
-                START WITH id = 0
-                CONNECT BY PRIOR id = parent_id
-                ORDER SIBLINGS BY position
-            """)
-            
-            # Clear the plan table for next time
-            await self._execute_cursor_no_fetch(cursor,"DELETE FROM plan_table")
-            await self._commit(conn)
+            # Explain the query and read back its plan in a single round trip: the
+            # block runs EXPLAIN PLAN dynamically, tagged so only this call's rows
+            # are read, and opens a ref cursor over the plan as formatted by
+            # DBMS_XPLAN, with cost and cardinality per step.
+            # STATEMENT_ID must be a literal of at most 30 characters (it is a
+            # VARCHAR2(30) column); 30 random hex digits fit and are safe to concatenate.
+            statement_id = uuid.uuid4().hex[:30]
+            plan_rows, = await self._execute_ref_cursors(cursor, """
+                BEGIN
+                    EXECUTE IMMEDIATE 'EXPLAIN PLAN SET STATEMENT_ID = ''' || :statement_id
+                                      || ''' FOR ' || :query;
+                    OPEN :plan_cur FOR
+                        SELECT plan_table_output
+                        FROM TABLE(DBMS_XPLAN.DISPLAY('PLAN_TABLE', :statement_id, 'BASIC +COST +ROWS'));
+                END;
+            """, ["plan_cur"],
+                arraysize=SMALL_ARRAYSIZE,
+                statement_id=statement_id,
+                query=query.strip().rstrip(";"))
+            
+            # No DELETE/COMMIT: the plan rows are never committed, so they are rolled
+            # back when the connection goes back to the pool
             
             # Also get some basic optimization hints based on query content
             basic_analysis = self._analyze_query_for_optimization(query)
             
-            return {
+            result = {
                 "execution_plan": [row[0] for row in plan_rows],
                 "optimization_suggestions": basic_analysis
             }
+            
+            self._plan_cache[cache_key] = (time.monotonic(), result)
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
+            return dict(result)
         except oracledb.Error as e:
-            print(f"Error explaining query: {str(e)}", file=sys.stderr)
+            logger.exception("Error explaining query")
             return {
                 "execution_plan": [],
                 "optimization_suggestions": ["Unable to generate execution plan due to error."],
@@ -857,50 +1488,59 @@ class DatabaseConnector:
         finally:
             await self._close_connection(conn)
             
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Cache key for a query: plain comments dropped and whitespace collapsed.
+
+        Optimizer hints are kept and case is preserved, since both can change the plan.
+        Quoted literals and identifiers are left untouched.
+        """
+        query = _SQL_NORMALIZE_RE.sub(lambda m: m.group(1) or " ", query)
+        return query.strip().rstrip(";").rstrip()
+
+    # (required bits, forbidden bits, suggestion), in the order suggestions are reported
+    _SUGG_RULES: List[Tuple[int, int, str]] = [
+        (_TOKEN_BITS["select_star"], 0,
+         "Consider selecting only needed columns instead of SELECT *"),
+        (_TOKEN_BITS["leading_wildcard"], 0,
+         "Leading wildcards in LIKE predicates prevent index usage"),
+        (_TOKEN_BITS["in_subquery"], _TOKEN_BITS["exists"],
+         "Consider using EXISTS instead of IN with subqueries for better performance"),
+        (_TOKEN_BITS["or"], 0,
+         "OR conditions may prevent index usage. Consider UNION ALL of separated queries"),
+        (_LONG_QUERY, _ANY_HINT,
+         "Complex query could benefit from optimizer hints"),
+        (_MANY_JOINS, _TOKEN_BITS["hint_leading"],
+         "Multi-table joins may benefit from LEADING hint to control join order"),
+        (_MULTI_JOIN, _TOKEN_BITS["hint_use_nl"] | _TOKEN_BITS["hint_use_hash"],
+         "Consider join method hints like USE_NL or USE_HASH for complex joins"),
+    ]
+
     def _analyze_query_for_optimization(self, query: str) -> List[str]:
         """Simple heuristic analysis of query for basic optimization suggestions"""
-        query = query.upper()
-        suggestions = []
+        # Tally every token of interest in a single scan of the query; the pattern
+        # ignores case, so no upper-cased copy of the query is made
+        counts: Dict[str, int] = {}
+        for match in _OPTIMIZATION_TOKENS_RE.finditer(query):
+            counts[match.lastgroup] = counts.get(match.lastgroup, 0) + 1
+        join_count = counts.get("join", 0)
+        from_count = counts.get("from", 0)
         
-        # Check for common inefficient patterns
-        if "SELECT *" in query:
-            suggestions.append("Consider selecting only needed columns instead of SELECT *")
-            
-        if " LIKE '%something" in query or " LIKE '%something%'" in query:
-            suggestions.append("Leading wildcards in LIKE predicates prevent index usage")
-            
-        if " IN (SELECT " in query and " EXISTS" not in query:
-            suggestions.append("Consider using EXISTS instead of IN with subqueries for better performance")
-            
-        if " OR " in query:
-            suggestions.append("OR conditions may prevent index usage. Consider UNION ALL of separated queries")
-            
-        if "/*+ " not in query and len(query) > 500:
-            suggestions.append("Complex query could benefit from optimizer hints")
-            
-        if " JOIN " in query:
-            if "/*+ LEADING" not in query and query.count("JOIN") > 2:
-                suggestions.append("Multi-table joins may benefit from LEADING hint to control join order")
-            
-            if "/*+ USE_NL" not in query and "/*+ USE_HASH" not in query and query.count("JOIN") > 1:
-                suggestions.append("Consider join method hints like USE_NL or USE_HASH for complex joins")
+        # Fold the tallies into one bit mask and check every rule against it
+        present = ((len(query) > 500) * _LONG_QUERY
+                   | (join_count > 1) * _MULTI_JOIN
+                   | (join_count > 2) * _MANY_JOINS)
+        for token in counts:
+            present |= _TOKEN_BITS[token]
+        suggestions = [
+            text for required, forbidden, text in self._SUGG_RULES
+            if present & required == required and not present & forbidden
+        ]
         
         # Count number of tables and joins
-        join_count = query.count(" JOIN ")
-        from_count = query.count(" FROM ")
         table_count = max(from_count, join_count + 1)
         
         if table_count > 4:
             suggestions.append(f"Query joins {table_count} tables - consider reviewing join order and conditions")
             
         return suggestions
-
-    async def _close_connection(self, conn):
-        """Helper method to close connection based on mode"""
-        try:
-            if self.thick_mode:
-                conn.close()  # Synchronous close for thick mode
-            else:
-                await conn.close()  # Async close for thin mode
-        except Exception as e:
-            print(f"Error closing connection: {str(e)}", file=sys.stderr)
\ No newline at end of file
@@ -125,47 +125,43 @@ class SchemaManager(SchemaManagerProtocol):
 
     async def get_schema_info(self, table_name: str) -> Optional[TableInfo]:
         """Get schema information for a specific table, loading it if necessary"""
+        return (await self.get_schemas_info([table_name]))[table_name]
+
+    async def get_schemas_info(self, table_names: List[str]) -> Dict[str, Optional[TableInfo]]:
+        """Get schema information for several tables, loading missing ones concurrently"""
         if not self.cache:
             self.cache = await self.load_or_build_cache()
             
-        table_name = table_name.upper()
+        names = [table_name.upper() for table_name in table_names]
+        to_load = list(dict.fromkeys(
+            name for name in names
+            if name in self.cache.all_table_names
+            and (name not in self.cache.tables or not self.cache.tables[name].fully_loaded)
+        ))
         
-        # Check if we know about this table
-        if table_name not in self.cache.all_table_names:
-            return None
-            
-        # Check if we have the table in our cache
-        if table_name not in self.cache.tables:
-            self.cache.tables[table_name] = TableInfo(
-                table_name=table_name,
-                columns=[], 
-                relationships={}, 
-                fully_loaded=False
-            )
+        if to_load:
+            print(f"Lazily loading details for {len(to_load)} tables...", file=sys.stderr)
+            loaded = await self.db_connector.load_tables_bulk(to_load)
+            for table_name, table_details in loaded.items():
+                if table_details:
+                    self.cache.tables[table_name] = TableInfo(
+                        table_name=table_name,
+                        columns=table_details["columns"],
+                        relationships=table_details["relationships"],
+                        fully_loaded=True,
+                        object_type=table_details.get("object_type", "TABLE")
+                    )
+                else:
+                    # Table doesn't actually exist, remove it from our cache
+                    self.cache.tables.pop(table_name, None)
+                    self.cache.all_table_names.discard(table_name)
+            # Save the updated cache to disk once for the whole batch
+            await self.save_cache()
             
-        # If the table isn't fully loaded, load it now
-        if not self.cache.tables[table_name].fully_loaded:
-            print(f"Lazily loading details for table {table_name}...", file=sys.stderr)
-            table_details = await self.db_connector.load_table_details(table_name)
-            if table_details:
-                table_info = TableInfo(
-                    table_name=table_name,
-                    columns=table_details["columns"],
-                    relationships=table_details["relationships"],
-                    fully_loaded=True,
-                    object_type=table_details.get("object_type", "TABLE")
-                )
-                self.cache.tables[table_name] = table_info
-                # Save the updated cache to disk
-                await self.save_cache()
-            else:
-                # Table doesn't actually exist, remove it from our cache
-                self.cache.tables.pop(table_name, None)
-                self.cache.all_table_names.discard(table_name)
-                await self.save_cache()
-                return None
-                
-        return self.cache.tables.get(table_name)
+        return {
+            table_name: self.cache.tables.get(name) if name in self.cache.all_table_names else None
+            for table_name, name in zip(table_names, names)
+        }
 
     async def search_tables(self, search_term: str, limit: int = 20) -> List[str]:
         """
@@ -232,7 +228,8 @@ class SchemaManager(SchemaManagerProtocol):
             if uncached_tables:
                 try:
                     # Search for columns in uncached tables using database connector
-                    db_results = await self.db_connector.search_columns_in_database(uncached_tables, search_term)
+                    db_results = await self.db_connector.search_columns_in_database(
+                        uncached_tables, search_term, limit - len(result))
                     
                     # Merge database results with cache results
                     for table_name, columns in db_results.items():
@@ -285,4 +282,21 @@ class SchemaManager(SchemaManagerProtocol):
         self.object_cache[cache_type][key] = {
             'data': data,
             'timestamp': time.time()
-        }
\ No newline at end of file
+        }
+
+    def invalidate(self, object_name: str) -> None:
+        """Drop cached metadata for a single table or view so the next lookup refetches it"""
+        name = object_name.upper()
+        for cache_type in ('constraints', 'indexes'):
+            self.object_cache.get(cache_type, {}).pop(name, None)
+        self.object_cache.get('related_tables', {}).pop(f"related_{name}", None)
+        if self.cache and name in self.cache.tables:
+            self.cache.tables[name].fully_loaded = False
+        self.db_connector.clear_preloaded_metadata(name)
+
+    def clear_cache(self) -> None:
+        """Drop all cached object metadata (PL/SQL, constraints, indexes, types, relationships)"""
+        for cache_type in self.ttl:
+            self.object_cache[cache_type] = {}
+        self.db_connector.clear_preloaded_metadata()
+        self.db_connector.invalidate_cache()
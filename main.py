@@ -18,6 +18,11 @@ TARGET_SCHEMA = os.getenv('TARGET_SCHEMA')  # Optional schema override
 CACHE_DIR = os.getenv('CACHE_DIR', '.cache')
 USE_THICK_MODE = os.getenv('THICK_MODE', '').lower() in ('true', '1', 'yes')  # Convert string to boolean
 ORACLE_CLIENT_LIB_DIR = os.getenv('ORACLE_CLIENT_LIB_DIR', None)
+POOL_MIN = int(os.getenv('POOL_MIN', '2'))
+POOL_MAX = int(os.getenv('POOL_MAX', '20'))
+POOL_INCREMENT = int(os.getenv('POOL_INCREMENT', '2'))
+POOL_BURST_MAX = int(os.getenv('POOL_BURST_MAX', '40'))  # Pooled plus temporary connections under load
+CALL_TIMEOUT = int(os.getenv('CALL_TIMEOUT', '30000'))  # Per database call, in milliseconds
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[DatabaseContext]:
@@ -35,7 +40,12 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[DatabaseContext]:
         cache_path=cache_dir / 'schema_cache.json',
         target_schema=TARGET_SCHEMA,
         use_thick_mode=USE_THICK_MODE,  # Pass the thick mode setting
-        lib_dir=ORACLE_CLIENT_LIB_DIR
+        lib_dir=ORACLE_CLIENT_LIB_DIR,
+        pool_min=POOL_MIN,
+        pool_max=POOL_MAX,
+        pool_increment=POOL_INCREMENT,
+        pool_burst_max=POOL_BURST_MAX,
+        call_timeout_ms=CALL_TIMEOUT
     )
     
     try:
@@ -127,9 +137,10 @@ async def get_tables_schema(table_names: List[str], ctx: Context) -> str:
     """
     db_context: DatabaseContext = ctx.request_context.lifespan_context
     results = []
+    tables_info = await db_context.get_schemas_info(table_names)
     
     for table_name in table_names:
-        table_info = await db_context.get_schema_info(table_name)
+        table_info = tables_info[table_name]
         if not table_info:
             results.append(f"\nTable or view '{table_name}' not found in the schema.")
             continue
@@ -307,6 +318,7 @@ async def get_pl_sql_objects(object_type: str, name_pattern: Optional[str], ctx:
     Args:
         object_type: Type of object to search for (PROCEDURE, FUNCTION, PACKAGE, TRIGGER, TYPE, etc.)
                     Must be a valid database object type. The value is automatically converted to uppercase.
+                    Several types can be requested at once separated by commas, e.g. "PROCEDURE,FUNCTION".
         name_pattern: Pattern to filter object names (case-insensitive, supports % wildcards).
                      e.g., "CUSTOMER%" will find all objects starting with "CUSTOMER", "%ORDER%" will find 
                      objects containing "ORDER". If null or empty, all objects of the specified type are returned.
@@ -318,7 +330,13 @@ async def get_pl_sql_objects(object_type: str, name_pattern: Optional[str], ctx:
     db_context: DatabaseContext = ctx.request_context.lifespan_context
     
     try:
-        objects = await db_context.get_pl_sql_objects(object_type.upper(), name_pattern)
+        object_types = [t.strip().upper() for t in object_type.split(',') if t.strip()]
+        if len(object_types) > 1:
+            objects = await db_context.get_pl_sql_objects_bulk(object_types, name_pattern)
+        elif object_types:
+            objects = await db_context.get_pl_sql_objects(object_types[0], name_pattern)
+        else:
+            objects = []
         
         if not objects:
             pattern_msg = f" matching '{name_pattern}'" if name_pattern else ""